@@ -1,11 +1,23 @@
+import { useState } from 'react';
 import { T } from '../../theme';
 import TransmissionCard from './TransmissionCard';
 
+/** Cards rendered per page; older items are rendered on demand. */
+const PAGE_SIZE = 200;
+
+/** Stable key so prepending a live exchange doesn't re-render every card. */
+function itemKey(item) {
+  if (item.session_id != null) return `${item.session_id}:${item.timestamp_ms}`;
+  return `${item.channel ?? ''}:${item.timestamp || ''}:${item.person_from || ''}`;
+}
+
 /**
  * List of transmission cards. items = array of exchange-like or simulated row objects.
  * channelId: 0 = Demo, 1-7 = CH1-CH7 (for label/empty state).
+ * Paging resets on channel change because the parent keys this component on channelId.
  */
 export default function TransmissionFeed({ items = [], channelId, emptyMessage }) {
+  const [limit, setLimit] = useState(PAGE_SIZE);
   const defaultEmpty =
     channelId === 0
       ? 'No transmissions yet. Speak into the radio...'
@@ -29,9 +41,27 @@ export default function TransmissionFeed({ items = [], channelId, emptyMessage }
 
   return (
     <div>
-      {items.map((item, i) => (
-        <TransmissionCard key={i} item={item} />
+      {items.slice(0, limit).map((item) => (
+        <TransmissionCard key={itemKey(item)} item={item} />
       ))}
+      {items.length > limit && (
+        <button
+          onClick={() => setLimit(limit + PAGE_SIZE)}
+          style={{
+            width: '100%',
+            padding: '10px 14px',
+            borderRadius: 6,
+            border: `1px solid ${T.border}`,
+            background: T.surface,
+            cursor: 'pointer',
+            color: T.dim,
+            fontSize: 12,
+            fontWeight: 600,
+          }}
+        >
+          Show older ({items.length - limit} more)
+        </button>
+      )}
     </div>
   );
 }
@@ -65,7 +65,7 @@ export default function LiveOverview() {
         {feedError && (
           <div style={{ color: T.red, fontSize: 12, marginBottom: 10 }}>{feedError}</div>
         )}
-        <TransmissionFeed items={feedItems} channelId={feedChannel} />
+        <TransmissionFeed key={feedChannel} items={feedItems} channelId={feedChannel} />
       </Card>
     </div>
   );
@@ -1,9 +1,35 @@
 import { useState, useEffect } from 'react';
 
-const POLL_MS = 2000;
+// Fallback polling: POLL_MIN_MS while the feed changes, backing off to POLL_MAX_MS while idle
+const POLL_MIN_MS = 1000;
+const POLL_MAX_MS = 30000;
+const MAX_EXCHANGES = 100;
+
+function exchangeKey(ex) {
+  return `${ex.session_id}:${ex.timestamp_ms}`;
+}
+
+/**
+ * Replace one exchange in a newest-first list, or prepend it when insert is set.
+ * A response whose transcript isn't in the list (trimmed or missed) is dropped.
+ */
+function upsertExchange(list, ex, insert) {
+  const key = exchangeKey(ex);
+  const idx = list.findIndex((item) => exchangeKey(item) === key);
+  if (idx >= 0) {
+    const next = list.slice();
+    next[idx] = ex;
+    return next;
+  }
+  if (!insert) return list;
+  return [ex, ...list].slice(0, MAX_EXCHANGES);
+}
 
 /**
- * Poll GET /api/feed every 2s. Returns { exchanges, loading, error }.
+ * Live feed from GET /api/feed/stream (Server-Sent Events): a snapshot on connect,
+ * then one event per new transcript or response. Falls back to polling GET /api/feed
+ * (with backoff while nothing changes) where EventSource is unavailable.
+ * Returns { exchanges, loading, error }.
  * Used for the live "Demo" channel.
  */
 export function useDemoFeed() {
@@ -12,18 +38,48 @@ export function useDemoFeed() {
   const [error, setError] = useState(null);
 
   useEffect(() => {
+    if (typeof EventSource !== 'undefined') {
+      const source = new EventSource('/api/feed/stream');
+      const onExchange = (insert) => (e) =>
+        setExchanges((prev) => upsertExchange(prev, JSON.parse(e.data), insert));
+
+      source.addEventListener('snapshot', (e) => {
+        setExchanges(JSON.parse(e.data).exchanges || []);
+        setError(null);
+        setLoading(false);
+      });
+      source.addEventListener('new_transcript', onExchange(true));
+      source.addEventListener('new_response', onExchange(false));
+      // EventSource reconnects on its own and receives a fresh snapshot
+      source.onerror = () => {
+        setError('Feed connection lost, reconnecting...');
+        setLoading(false);
+      };
+      return () => source.close();
+    }
+
     let cancelled = false;
+    let timer = null;
+    let delay = POLL_MIN_MS;
+    let lastEtag = null;
 
+    /** Fetch the feed; resolves true when it changed since the last fetch. */
     async function fetchFeed() {
+      let changed = false;
       try {
         const res = await fetch('/api/feed');
         if (!res.ok) throw new Error(`HTTP ${res.status}`);
-        const data = await res.json();
-        if (!cancelled) {
-          setExchanges(data.exchanges || []);
-          setError(null);
+        // The server's ETag moves with every posted event (the browser revalidates with it)
+        const etag = res.headers.get('ETag');
+        changed = etag === null || etag !== lastEtag;
+        if (changed) {
+          const data = await res.json();
+          lastEtag = etag;
+          if (!cancelled) setExchanges(data.exchanges || []);
         }
+        if (!cancelled) setError(null);
       } catch (e) {
+        lastEtag = null; // exchanges were cleared: take the next response in full
         if (!cancelled) {
           setError(e.message || 'Failed to load feed');
           setExchanges([]);
@@ -31,13 +87,21 @@ export function useDemoFeed() {
       } finally {
         if (!cancelled) setLoading(false);
       }
+      return changed;
+    }
+
+    async function tick() {
+      const changed = await fetchFeed();
+      if (cancelled) return;
+      delay = changed ? POLL_MIN_MS : Math.min(delay * 1.5, POLL_MAX_MS);
+      // Jitter so several tabs don't poll in lockstep
+      timer = setTimeout(tick, delay * (0.8 + Math.random() * 0.4));
     }
 
-    fetchFeed();
-    const id = setInterval(fetchFeed, POLL_MS);
+    tick();
     return () => {
       cancelled = true;
-      clearInterval(id);
+      clearTimeout(timer);
     };
   }, []);
 
@@ -4,30 +4,51 @@ NVIDIA Parakeet ASR: NeMo when available, Hugging Face Transformers fallback on
 Accepts 16 kHz mono float audio, returns transcript text.
 """
 
+import contextlib
 import numpy as np
+import struct
 import tempfile
 import os
 from pathlib import Path
-from typing import Optional, Any
+from typing import List, Optional, Any
 
 AUDIO_RATE = 16000
 
 # On Jetson we use HF Parakeet CTC (no NeMo). Use 1.1b: 0.6b repo lacks processor_config.json.
 HF_FALLBACK_MODEL = "nvidia/parakeet-ctc-1.1b"
+# Segment lengths (s) run through the model by warmup(): short keys, typical, long
+WARMUP_SECONDS = (1, 4, 10)
+
+# NeMo's path-only fallback needs real files; keep them on tmpfs (RAM) where available
+_WAV_TMP_DIR = "/dev/shm" if os.access("/dev/shm", os.W_OK) else None
 
 
 def _float_to_wav_bytes(audio: np.ndarray, rate: int = AUDIO_RATE) -> bytes:
     """Convert float32 [-1,1] to 16-bit PCM WAV bytes."""
-    import wave
-    import io
-    audio_i16 = (np.clip(audio, -1.0, 1.0) * 32767).astype(np.int16)
-    buf = io.BytesIO()
-    with wave.open(buf, "wb") as w:
-        w.setnchannels(1)
-        w.setsampwidth(2)
-        w.setframerate(rate)
-        w.writeframes(audio_i16.tobytes())
-    return buf.getvalue()
+    # Scale into one preallocated int16 buffer (no clip/scale/astype temporaries)
+    pcm = np.empty(len(audio), dtype=np.int16)
+    np.multiply(np.clip(audio, -1.0, 1.0), 32767, out=pcm, casting="unsafe")
+    nbytes = pcm.nbytes
+    # 44-byte RIFF/WAVE header: PCM, mono, 16-bit
+    header = struct.pack(
+        "<4sI4s4sIHHIIHH4sI",
+        b"RIFF", 36 + nbytes, b"WAVE",
+        b"fmt ", 16, 1, 1, rate, rate * 2, 2, 16,
+        b"data", nbytes,
+    )
+    return header + pcm.tobytes()
+
+
+def _hypothesis_texts(hypotheses: Any) -> List[str]:
+    """Texts of NeMo transcribe() results (Hypothesis objects or plain strings), one per input.
+    RNNT models on some NeMo versions return (best, all) tuples; only the best list is used."""
+    if isinstance(hypotheses, tuple):
+        hypotheses = hypotheses[0]
+    texts = []
+    for hyp in hypotheses or []:
+        text = getattr(hyp, "text", None) or str(hyp)
+        texts.append((text or "").strip())
+    return texts
 
 
 def _load_nemo(model_name: str, device: str) -> Any:
@@ -74,11 +95,20 @@ class ParakeetASR:
     (where the PyTorch wheel has no torch.distributed).
     """
 
-    def __init__(self, model_name: str = "nvidia/parakeet-rnnt-0.6b", device: str = "cuda"):
+    def __init__(
+        self,
+        model_name: str = "nvidia/parakeet-rnnt-0.6b",
+        device: str = "cuda",
+        fp16: bool = False,
+    ):
         self.model_name = model_name
         self.device = device
+        # Half-precision inference (tensor cores on Jetson Orin); CUDA only
+        self.fp16 = fp16 and device == "cuda"
         self._backend: Optional[str] = None
         self._model: Any = None
+        # None until the first NeMo call shows whether transcribe() takes arrays
+        self._nemo_accepts_arrays: Optional[bool] = None
 
     def load(self) -> None:
         # Prefer NeMo; on Jetson it often fails (slim torch has no torch._C._distributed_c10d).
@@ -90,6 +120,9 @@ class ParakeetASR:
         # Fallback: Hugging Face Parakeet CTC (no NeMo, no torch.distributed).
         try:
             self._backend, self._model = _load_hf(self.model_name, self.device)
+            if self.fp16:
+                processor, model = self._model
+                self._model = (processor, model.half())
             return
         except ImportError as e:
             raise ImportError(
@@ -97,42 +130,100 @@ class ParakeetASR:
             ) from e
         raise RuntimeError("NeMo and Hugging Face Parakeet fallback both failed.")
 
-    def transcribe(self, audio: np.ndarray, sample_rate: int = AUDIO_RATE) -> str:
+    def warmup(self, max_batch: int = 1) -> None:
+        """Load the model and run silence of a few typical segment lengths through it (alone and,
+        with max_batch > 1, as a full batch), so CUDA init, kernel selection and the allocator's
+        pools for those shapes are set up before the first real segment instead of during it."""
         if self._model is None:
             self.load()
-        if sample_rate != AUDIO_RATE:
-            from scipy import signal
-            num = int(round(len(audio) * AUDIO_RATE / sample_rate))
-            audio = signal.resample(audio, num).astype(np.float32)
-        if len(audio) == 0:
-            return ""
-
-        if self._backend == "nemo":
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                f.write(_float_to_wav_bytes(audio, AUDIO_RATE))
-                path = f.name
+        for seconds in WARMUP_SECONDS:
+            silence = np.zeros(int(seconds * AUDIO_RATE), dtype=np.float32)
+            self.transcribe(silence)
+            if max_batch > 1:
+                self.transcribe_batch([silence] * max_batch)
+
+    def _nemo_autocast(self) -> Any:
+        """fp16: autocast NeMo's forward (its feature extractor must stay fp32, so no .half())."""
+        if not self.fp16:
+            return contextlib.nullcontext()
+        import torch
+        return torch.autocast("cuda", dtype=torch.float16)
+
+    def _transcribe_nemo(self, audios: List[np.ndarray]) -> List[str]:
+        """NeMo: pass the arrays straight to transcribe(); older NeMo only takes file paths and
+        rejects arrays with a TypeError/ValueError, which switches this instance to the temp WAV
+        route once that route works. Any other error is raised as usual."""
+        with self._nemo_autocast():
+            return self._transcribe_nemo_inner(audios)
+
+    def _transcribe_nemo_inner(self, audios: List[np.ndarray]) -> List[str]:
+        if self._nemo_accepts_arrays is not False:
             try:
-                hypotheses = self._model.transcribe([path])
-                if hypotheses and len(hypotheses) > 0:
-                    text = getattr(hypotheses[0], "text", None) or str(hypotheses[0])
-                    return (text or "").strip()
-                return ""
-            finally:
+                hypotheses = self._model.transcribe(audios, batch_size=len(audios))
+                self._nemo_accepts_arrays = True
+                return _hypothesis_texts(hypotheses)
+            except (TypeError, ValueError):
+                if self._nemo_accepts_arrays:
+                    raise
+
+        paths = []
+        try:
+            for audio in audios:
+                with tempfile.NamedTemporaryFile(suffix=".wav", delete=False, dir=_WAV_TMP_DIR) as f:
+                    paths.append(f.name)
+                    f.write(_float_to_wav_bytes(audio, AUDIO_RATE))
+            texts = _hypothesis_texts(self._model.transcribe(paths, batch_size=len(paths)))
+            self._nemo_accepts_arrays = False
+            return texts
+        finally:
+            for path in paths:
                 try:
                     os.unlink(path)
                 except Exception:
                     pass
 
-        # Hugging Face
-        processor, model = self._model
-        inputs = processor(
-            [audio],
-            sampling_rate=AUDIO_RATE,
-            return_tensors="pt",
-            padding=True,
-        )
-        inputs = inputs.to(model.device)
-        with np.errstate(divide="ignore", invalid="ignore"):
-            outputs = model.generate(**inputs)
-        text = processor.batch_decode(outputs, skip_special_tokens=True)
-        return (text[0].strip() if text else "")
+    def transcribe_batch(self, audios: List[np.ndarray], sample_rate: int = AUDIO_RATE) -> List[str]:
+        """Transcribe several segments in one model call (one forward pass on GPU). Returns one
+        text per input, "" for empty audio."""
+        if self._model is None:
+            self.load()
+        if sample_rate != AUDIO_RATE:
+            from fractions import Fraction
+            from scipy import signal
+            ratio = (Fraction(AUDIO_RATE) / Fraction(sample_rate)).limit_denominator(1000)
+            audios = [
+                signal.resample_poly(a, ratio.numerator, ratio.denominator).astype(np.float32)
+                for a in audios
+            ]
+        texts = [""] * len(audios)
+        todo = [i for i, a in enumerate(audios) if len(a) > 0]
+        if not todo:
+            return texts
+        batch = [np.asarray(audios[i], dtype=np.float32) for i in todo]
+
+        if self._backend == "nemo":
+            results = self._transcribe_nemo(batch)
+        else:
+            # Hugging Face: the processor pads the batch to the longest segment
+            processor, model = self._model
+            inputs = processor(
+                batch,
+                sampling_rate=AUDIO_RATE,
+                return_tensors="pt",
+                padding=True,
+            )
+            if self.fp16:
+                # Float features to fp16 to match the weights; integer tensors only move device
+                inputs = inputs.to(model.device, dtype=model.dtype)
+            else:
+                inputs = inputs.to(model.device)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                outputs = model.generate(**inputs)
+            results = [t.strip() for t in processor.batch_decode(outputs, skip_special_tokens=True)]
+
+        for i, text in zip(todo, results):
+            texts[i] = text
+        return texts
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int = AUDIO_RATE) -> str:
+        return self.transcribe_batch([audio], sample_rate)[0]
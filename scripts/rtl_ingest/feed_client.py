@@ -1,10 +1,46 @@
 #!/usr/bin/env python3
 """POST transcript events to the feed server with optional channel id."""
 
+import http.client
 import json
+import threading
 import time
-import urllib.request
-from typing import Optional
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# One keep-alive connection per (scheme, host, port) per thread: no TCP handshake per event
+_local = threading.local()
+
+# notify_feed_async: POSTs run on a small pool; at most MAX_IN_FLIGHT queued or running, so an
+# unreachable feed server can't pile up work behind the 5 s timeout
+NOTIFY_WORKERS = 4
+MAX_IN_FLIGHT = 16
+_notify_pool = ThreadPoolExecutor(max_workers=NOTIFY_WORKERS, thread_name_prefix="notify")
+_in_flight = threading.BoundedSemaphore(MAX_IN_FLIGHT)
+
+
+def _connection(feed_url: str) -> Tuple[http.client.HTTPConnection, str]:
+    """Reusable connection for feed_url's host (created on first use) and the request path."""
+    parts = urlsplit(feed_url)
+    key = (parts.scheme, parts.hostname, parts.port)
+    conns = getattr(_local, "conns", None)
+    if conns is None:
+        conns = _local.conns = {}
+    conn = conns.get(key)
+    if conn is None:
+        cls = http.client.HTTPSConnection if parts.scheme == "https" else http.client.HTTPConnection
+        conn = conns[key] = cls(parts.hostname, parts.port, timeout=5)
+    path = parts.path or "/"
+    if parts.query:
+        path += "?" + parts.query
+    return conn, path
+
 
 def notify_feed(
     feed_url: str,
@@ -28,15 +64,47 @@ def notify_feed(
     }
     if channel is not None and 1 <= channel <= 7:
         payload["channel"] = channel
-    body = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(
-        feed_url,
-        data=body,
-        method="POST",
-        headers={"Content-Type": "application/json"},
-    )
+    body = orjson.dumps(payload) if orjson is not None else json.dumps(payload).encode("utf-8")
     try:
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            return resp.status == 200
+        conn, path = _connection(feed_url)
     except Exception:
         return False
+    # A kept-alive socket the server has since closed fails on first use; retry that once on
+    # a fresh connection instead of losing the transcript
+    for attempt in range(2):
+        reused = conn.sock is not None
+        try:
+            conn.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+            resp = conn.getresponse()
+            resp.read()  # drain so the connection can be reused
+            return resp.status == 200
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            conn.close()
+            if not (reused and attempt == 0):
+                return False
+        except Exception:
+            # Drop the connection; the next call reconnects
+            conn.close()
+            return False
+    return False
+
+
+def notify_feed_async(
+    feed_url: str,
+    transcript: str,
+    channel: Optional[int] = None,
+    session_id: Optional[str] = None,
+) -> Optional[Future]:
+    """
+    notify_feed on a background thread; returns its Future (result: bool), or None when
+    MAX_IN_FLIGHT posts are already pending and this one was dropped.
+    """
+    if not _in_flight.acquire(blocking=False):
+        return None
+    try:
+        future = _notify_pool.submit(notify_feed, feed_url, transcript, channel, session_id)
+    except Exception:
+        _in_flight.release()
+        raise
+    future.add_done_callback(lambda _: _in_flight.release())
+    return future
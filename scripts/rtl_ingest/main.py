@@ -6,13 +6,35 @@ Run separately from memo-RF; config in config/rtl_ingest.json.
 
 import argparse
 import json
+import logging
+import logging.handlers
+import queue
 import sys
 import threading
-import time
 from pathlib import Path
 
 REPO_ROOT = Path(__file__).resolve().parent.parent.parent
 CONFIG_PATH = REPO_ROOT / "config" / "rtl_ingest.json"
+ASR_MAX_BATCH = 7  # segments per ASR call (one per channel)
+
+# ASR and notify threads log through a queue; the listener thread does the console writes
+log = logging.getLogger("rtl_ingest")
+
+
+def start_log_listener() -> logging.handlers.QueueListener:
+    """Route `log` through a queue to a background thread: info to stdout, warnings and
+    errors to stderr. Returns the started QueueListener."""
+    q: queue.SimpleQueue = queue.SimpleQueue()
+    out = logging.StreamHandler(sys.stdout)
+    out.addFilter(lambda record: record.levelno < logging.WARNING)
+    err = logging.StreamHandler(sys.stderr)
+    err.setLevel(logging.WARNING)
+    listener = logging.handlers.QueueListener(q, out, err, respect_handler_level=True)
+    log.addHandler(logging.handlers.QueueHandler(q))
+    log.setLevel(logging.INFO)
+    log.propagate = False
+    listener.start()
+    return listener
 
 
 def load_config(path: Path) -> dict:
@@ -24,8 +46,7 @@ def run_ingest(config: dict, device_index: int = 0) -> None:
     from .channelizer import RTLChannelizerStream
     from .vad import SimpleVAD
     from .asr_parakeet import ParakeetASR
-    from .feed_client import notify_feed
-    import queue
+    from .feed_client import notify_feed_async
     import concurrent.futures
 
     center_mhz = config["center_freq_mhz"]
@@ -38,6 +59,7 @@ def run_ingest(config: dict, device_index: int = 0) -> None:
     feed_url = config.get("feed_server_url", "http://localhost:5050/api/feed/notify")
     model_name = config.get("parakeet_model", "nvidia/parakeet-rnnt-0.6b")
     device = config.get("device", "cuda")
+    fp16 = bool(config.get("fp16", False))
     vad_cfg = config.get("vad", {})
     vad_threshold = vad_cfg.get("threshold", 0.02)
     vad_min_speech_ms = vad_cfg.get("min_speech_ms", 400)
@@ -47,23 +69,60 @@ def run_ingest(config: dict, device_index: int = 0) -> None:
     # ASR worker queue: (channel_1based, audio_float32)
     segment_queue = queue.Queue(maxsize=64)
 
+    # Load and warm up ASR before capture starts, so the first segment doesn't wait on it
+    print("Loading Parakeet ASR...")
+    asr = ParakeetASR(model_name=model_name, device=device, fp16=fp16)
+    asr.warmup(max_batch=ASR_MAX_BATCH)
+
     def asr_worker():
-        asr = ParakeetASR(model_name=model_name, device=device)
-        asr.load()
-        while True:
+        stopping = False
+        while not stopping:
             try:
                 item = segment_queue.get(timeout=1.0)
-                if item is None:
-                    break
-                ch, audio = item
-                text = asr.transcribe(audio)
-                if text:
-                    ok = notify_feed(feed_url, text, channel=ch)
-                    print(f"[CH{ch}] {text[:60]}{'...' if len(text) > 60 else ''} -> feed ok={ok}")
             except queue.Empty:
                 continue
+            if item is None:
+                break
+            # Micro-batch: take whatever else is already queued (up to one per channel) so
+            # the model runs one forward pass for all of it
+            batch = [item]
+            while len(batch) < ASR_MAX_BATCH:
+                try:
+                    item = segment_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    stopping = True
+                    break
+                batch.append(item)
+            try:
+                texts = asr.transcribe_batch([audio for _, audio in batch])
             except Exception as e:
-                print(f"[ASR] error: {e}", file=sys.stderr)
+                if len(batch) == 1:
+                    log.error(f"[ASR] error: {e}")
+                    continue
+                # e.g. out of memory on a full batch: retry one segment at a time so a
+                # failure loses at most that segment
+                log.warning(f"[ASR] batch of {len(batch)} failed ({e}); retrying one by one")
+                texts = []
+                for ch, audio in batch:
+                    try:
+                        texts.append(asr.transcribe(audio))
+                    except Exception as e:
+                        log.error(f"[ASR] CH{ch} error: {e}")
+                        texts.append("")
+            for (ch, _), text in zip(batch, texts):
+                if not text:
+                    continue
+                # POST off the ASR thread; log once the feed server answers
+                label = f"[CH{ch}] {text[:60]}{'...' if len(text) > 60 else ''}"
+                future = notify_feed_async(feed_url, text, channel=ch)
+                if future is None:
+                    log.warning(f"{label} -> feed dropped (too many pending)")
+                else:
+                    future.add_done_callback(
+                        lambda f, label=label: log.info(f"{label} -> feed ok={f.result()}")
+                    )
 
     # Start ASR worker thread
     asr_thread = threading.Thread(target=asr_worker, daemon=False)
@@ -75,6 +134,8 @@ def run_ingest(config: dict, device_index: int = 0) -> None:
         sample_rate=sample_rate,
         frequencies_hz=freqs_hz,
         device_index=device_index,
+        squelch=config.get("squelch"),
+        gpu=bool(config.get("channelizer_gpu", False)),
     )
     vads = [
         SimpleVAD(
@@ -90,10 +151,8 @@ def run_ingest(config: dict, device_index: int = 0) -> None:
     stream.start()
     try:
         while True:
-            for ch in range(7):
-                block = stream.get_audio_block(ch)
-                if block is None:
-                    continue
+            # Blocks until the channelizer has output; no polling
+            for ch, block in stream.get_audio_blocks(timeout=1.0):
                 seg = vads[ch].process(block)
                 if seg is not None:
                     if segment_queue.full():
@@ -102,7 +161,6 @@ def run_ingest(config: dict, device_index: int = 0) -> None:
                         except queue.Empty:
                             pass
                     segment_queue.put((ch + 1, seg.copy()))
-            time.sleep(0.001)
     except KeyboardInterrupt:
         print("Stopping...")
     finally:
@@ -111,6 +169,8 @@ def run_ingest(config: dict, device_index: int = 0) -> None:
             if seg is not None:
                 segment_queue.put((ch + 1, seg))
         stream.stop()
+        if stream.channelizer.squelch is not None:
+            log.info(f"Squelch muted blocks per channel: {stream.channelizer.squelched_blocks.tolist()}")
         segment_queue.put(None)
         asr_thread.join(timeout=30.0)
 
@@ -124,7 +184,11 @@ def main():
         print(f"Config not found: {args.config}", file=sys.stderr)
         sys.exit(1)
     config = load_config(args.config)
-    run_ingest(config, device_index=args.device)
+    listener = start_log_listener()
+    try:
+        run_ingest(config, device_index=args.device)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
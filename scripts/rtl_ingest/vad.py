@@ -4,10 +4,11 @@ Simple energy-based VAD on 16 kHz float audio. Buffers frames and emits segments
 """
 
 import numpy as np
-from typing import List, Optional, Callable
+from typing import Optional, Callable
 import time
 
 AUDIO_RATE = 16000
+SEGMENT_BUFFER_S = 10
 
 
 class SimpleVAD:
@@ -31,53 +32,67 @@ class SimpleVAD:
         self.frame_samples = sample_rate * frame_duration_ms // 1000
         self._speech_frames = 0
         self._silence_frames = 0
-        self._buffer: List[np.ndarray] = []
+        # Segment audio is written into one preallocated float32 buffer (doubled if a segment
+        # outgrows it) instead of a list of frame copies joined at the end
+        self._buffer = np.empty(SEGMENT_BUFFER_S * sample_rate, dtype=np.float32)
+        self._write = 0
         self._in_speech = False
 
+    def _append(self, frame: np.ndarray) -> None:
+        end = self._write + len(frame)
+        if end > len(self._buffer):
+            grown = np.empty(max(end, 2 * len(self._buffer)), dtype=np.float32)
+            grown[: self._write] = self._buffer[: self._write]
+            self._buffer = grown
+        self._buffer[self._write : end] = frame
+        self._write = end
+
     def process(self, audio: np.ndarray) -> Optional[np.ndarray]:
         """
         Process a chunk of audio (any length). Returns one complete segment (float32)
         when speech ends, or None.
         """
-        offset = 0
-        while offset < len(audio):
-            frame = audio[offset : offset + self.frame_samples]
-            offset += len(frame)
-            if len(frame) < self.frame_samples:
-                break
-            rms = np.sqrt(np.mean(frame.astype(np.float64) ** 2))
-            if rms >= self.threshold:
+        # RMS of every whole frame in one pass (float32, no per-frame promotion), then walk the
+        # voiced mask run by run rather than frame by frame. A trailing partial frame is dropped.
+        n_frames = len(audio) // self.frame_samples
+        if n_frames == 0:
+            return None
+        samples = np.asarray(audio[: n_frames * self.frame_samples], dtype=np.float32)
+        frames = samples.reshape(n_frames, self.frame_samples)
+        energy = np.einsum("ij,ij->i", frames, frames) / self.frame_samples
+        voiced = np.sqrt(energy) >= self.threshold
+        # Run boundaries are where the mask flips
+        bounds = [0, *(np.flatnonzero(voiced[1:] != voiced[:-1]) + 1).tolist(), n_frames]
+        fs = self.frame_samples
+        for start, stop in zip(bounds[:-1], bounds[1:]):
+            if voiced[start]:
                 self._silence_frames = 0
-                self._speech_frames += 1
+                self._speech_frames += stop - start
                 if not self._in_speech:
-                    self._buffer = []
+                    self._write = 0
                     self._in_speech = True
-                self._buffer.append(frame.copy())
-            else:
-                if self._in_speech:
-                    self._silence_frames += 1
-                    self._buffer.append(frame.copy())
-                    if self._silence_frames >= self.end_silence_frames:
-                        if self._speech_frames >= self.min_speech_frames:
-                            segment = np.concatenate(self._buffer)
-                            self._buffer = []
-                            self._in_speech = False
-                            self._speech_frames = 0
-                            self._silence_frames = 0
-                            return segment
-                        self._in_speech = False
-                        self._buffer = []
-                        self._speech_frames = 0
-                        self._silence_frames = 0
-                else:
+                self._append(samples[start * fs : stop * fs])
+            elif self._in_speech:
+                # Silence extends the segment until end_silence_frames is reached
+                take = min(stop - start, self.end_silence_frames - self._silence_frames)
+                self._silence_frames += take
+                self._append(samples[start * fs : (start + take) * fs])
+                if self._silence_frames >= self.end_silence_frames:
+                    long_enough = self._speech_frames >= self.min_speech_frames
+                    segment = self._buffer[: self._write].copy() if long_enough else None
+                    self._write = 0
+                    self._in_speech = False
+                    self._speech_frames = 0
                     self._silence_frames = 0
+                    if segment is not None:
+                        return segment
         return None
 
     def flush(self) -> Optional[np.ndarray]:
         """Emit any buffered speech as one segment."""
-        if self._in_speech and len(self._buffer) > 0 and self._speech_frames >= self.min_speech_frames:
-            segment = np.concatenate(self._buffer)
-            self._buffer = []
+        if self._in_speech and self._write > 0 and self._speech_frames >= self.min_speech_frames:
+            segment = self._buffer[: self._write].copy()
+            self._write = 0
             self._in_speech = False
             self._speech_frames = 0
             self._silence_frames = 0
@@ -4,13 +4,25 @@ DEAD SIMPLE Feed Server
 API-only: receives POSTs, serves dashboard static files. No embedded HTML.
 """
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import json
+import copy
 import csv
+import gzip
+import logging
+import logging.handlers
 import mimetypes
+import os
+import queue
 import re
-from collections import defaultdict
+import stat
+import sys
+import tempfile
+import threading
+from collections import defaultdict, deque
 from pathlib import Path
+import time
+from concurrent.futures import ThreadPoolExecutor
 from urllib.parse import urlparse, parse_qs
 
 try:
@@ -18,9 +30,42 @@ try:
 except ImportError:
     datetime = None
 
-# In-memory storage
-events = []
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# In-memory storage (handlers run on threads; guard events with events_lock)
 MAX_EVENTS = 100
+events = deque(maxlen=MAX_EVENTS)  # newest first; appendleft drops the oldest past MAX_EVENTS
+events_lock = threading.Lock()
+# Bumped on every /api/feed/notify; keys the exchange cache below
+events_revision = 0
+# Distinguishes ETags across server restarts (revision restarts at 0)
+_BOOT_ID = '%x' % int(time.time())
+_exchanges_cache = {'revision': -1, 'exchanges': [], 'answered': None, 'body': None, 'gzip': None}
+
+# Held across POST /api/config's read-modify-write of active.json and config.json
+config_lock = threading.Lock()
+
+# Server-Sent Events: one queue of pre-encoded frames per /api/feed/stream client
+subscribers = []
+subscribers_lock = threading.Lock()
+SSE_HEARTBEAT_S = 30
+SSE_QUEUE_SIZE = 64
+
+# POST bodies (config updates, feed events) larger than this are refused with 413
+MAX_BODY_BYTES = 1 << 20
+# read_json_body's return value once it has already sent an error response
+BODY_REJECTED = object()
+
+# Request handlers log through a queue; start_log_listener() writes records on its own thread
+log = logging.getLogger('simple_feed')
+# MEMO_DEBUG=1 also logs every posted feed event
+DEBUG = os.environ.get('MEMO_DEBUG') == '1'
+
+# JSON responses larger than this are gzipped for clients that accept it
+GZIP_MIN_BYTES = 1024
 
 # Paths (repo root = parent of scripts/)
 SCRIPT_DIR = Path(__file__).resolve().parent
@@ -28,10 +73,12 @@ REPO_ROOT = SCRIPT_DIR.parent
 CONFIG_DIR = REPO_ROOT / 'config'
 CONFIG_PATH = CONFIG_DIR / 'config.json'
 PERSONAS_PATH = CONFIG_DIR / 'personas.json'
+LANGUAGE_VOICES_PATH = CONFIG_DIR / 'language_voices.json'
 ACTIVE_PATH = CONFIG_DIR / 'active.json'
 ROBOTS_DIR = CONFIG_DIR / 'robots'
 AGENTS_DIR = CONFIG_DIR / 'agents'
 DASHBOARD_DIR = REPO_ROOT / 'dashboard_dist'
+INDEX_PATH = DASHBOARD_DIR / 'index.html'
 CSV_PATH = REPO_ROOT / 'data' / 'hotel_14day.csv'
 
 # department_from -> channel (align with dashboard labels)
@@ -46,19 +93,248 @@ DEPT_TO_CHANNEL = {
 }
 
 
+def start_log_listener():
+    """Send `log` records through a queue to a background thread that writes stdout, so handlers
+    never block on console I/O. Returns the started QueueListener."""
+    q = queue.SimpleQueue()
+    console = logging.StreamHandler(sys.stdout)
+    console.setFormatter(logging.Formatter('%(message)s'))
+    listener = logging.handlers.QueueListener(q, console)
+    log.addHandler(logging.handlers.QueueHandler(q))
+    log.setLevel(logging.DEBUG if DEBUG else logging.INFO)
+    log.propagate = False
+    listener.start()
+    return listener
+
+
+def json_dumps(data, pretty=False):
+    """Serialize to JSON bytes; uses orjson when installed, stdlib json otherwise."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else 0)
+    if pretty:
+        return json.dumps(data, indent=2).encode('utf-8')
+    return json.dumps(data, separators=(',', ':')).encode('utf-8')
+
+
+def json_loads(raw):
+    """Parse JSON from bytes or str; uses orjson when installed."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def read_bytes(path):
+    """Read a whole file with raw os.read calls sized from fstat (no buffered file object)."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        size = os.fstat(fd).st_size
+        data = os.read(fd, size)
+        if len(data) < size:
+            # Short read (file changed underneath us): keep reading until EOF
+            chunks = [data]
+            while True:
+                chunk = os.read(fd, 65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+            data = b''.join(chunks)
+        return data
+    finally:
+        os.close(fd)
+
+
+def read_json(path):
+    """Read and parse a JSON file."""
+    return json_loads(read_bytes(path))
+
+
+def write_json(path, data):
+    """Write data to a JSON file, pretty-printed for humans editing config.
+    Writes a temp file in the same directory and os.replace()s it over the target, so
+    readers (and the agent on restart) never see a half-written file.
+    Returns False without touching disk when the file already holds exactly these bytes."""
+    path = str(path)
+    body = json_dumps(data, pretty=True)
+    try:
+        mode = os.stat(path).st_mode & 0o777
+        if read_bytes(path) == body:
+            return False
+    except FileNotFoundError:
+        mode = 0o644
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), prefix='.' + os.path.basename(path) + '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(body)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    # Coarse filesystem timestamps can miss two quick writes of the same size: drop cached reads
+    for key in [k for k in _file_cache if k[0] == path]:
+        _file_cache.pop(key, None)
+    return True
+
+
+# (path, builder) -> (stamp, value)
+_file_cache = {}
+# (path, builder) -> (stamp, gzip of the cached body): cached JSON is compressed once per change
+_gzip_cache = {}
+# (path, builder) -> lock held while that entry is (re)built
+_build_locks = {}
+
+
+def path_stamp(path):
+    """(st_mtime_ns, st_size) of a file. For a directory, also the newest entry mtime and total
+    entry size, so files edited in place (which leave the directory mtime alone) still count."""
+    st = os.stat(path)
+    if not stat.S_ISDIR(st.st_mode):
+        return (st.st_mtime_ns, st.st_size)
+    newest = total = 0
+    with os.scandir(path) as it:
+        for e in it:
+            est = e.stat()
+            newest = max(newest, est.st_mtime_ns)
+            total += est.st_size
+    return (st.st_mtime_ns, st.st_size, newest, total)
+
+
+def load_cached_stamped(path, build=read_json):
+    """(stamp, build(path)), reusing the last result until path_stamp(path) changes.
+    Raises OSError if the path is missing. Callers must not mutate the returned value."""
+    stamp = path_stamp(path)
+    key = (str(path), build)
+    hit = _file_cache.get(key)
+    if hit is not None and hit[0] == stamp:
+        return hit
+    # One builder per key: concurrent requests after a change wait for it instead of re-parsing
+    with _build_locks.setdefault(key, threading.Lock()):
+        hit = _file_cache.get(key)
+        if hit is None or hit[0] != stamp:
+            hit = _file_cache[key] = (stamp, build(path))
+    return hit
+
+
+def load_cached(path, build=read_json):
+    """Return build(path), reusing the last result until the file's mtime or size changes.
+    Raises OSError if the file is missing. Callers must not mutate the returned value."""
+    return load_cached_stamped(path, build)[1]
+
+
+def gzip_cached(path, build, stamp, body):
+    """gzip of a load_cached body, compressed once per stamp."""
+    key = (str(path), build)
+    hit = _gzip_cache.get(key)
+    if hit is None or hit[0] != stamp:
+        hit = _gzip_cache[key] = (stamp, gzip.compress(body, 6))
+    return hit[1]
+
+
+def build_personas_json(path):
+    """Serialize the /api/personas response body from personas.json."""
+    personas_data = read_json(path)
+    personas_list = [
+        {
+            'id': k,
+            'name': v['name'],
+            'category': v.get('category', ''),
+            'tagline': v.get('tagline', ''),
+            'description': v.get('description', ''),
+        }
+        for k, v in personas_data.items()
+    ]
+    return json_dumps({'personas': personas_list})
+
+
+def build_robots_json(path):
+    """Serialize the /api/robots response body from the robots config directory."""
+    return json_dumps({'robots': scan_identity_dir(path)})
+
+
+def build_agents_json(path):
+    """Serialize the /api/agents response body from the agents config directory."""
+    return json_dumps({'agents': scan_identity_dir(path)})
+
+
+def build_index_html(path):
+    """Read the dashboard entry page once; returns (raw bytes, gzip bytes)."""
+    html = read_bytes(path)
+    return html, gzip.compress(html, 9)
+
+
+# Precompressed siblings send_asset may serve instead of a file, in preference order
+# (Content-Encoding, file suffix)
+ASSET_ENCODINGS = (('br', '.br'), ('gzip', '.gz'))
+
+
+def build_asset_table(path):
+    """Map each file under the dashboard build (relative URL path) to
+    (absolute path, Content-Type, size, ETag, encoded), so static GETs need no path resolution or
+    stat. encoded lists the (Content-Encoding, absolute path, size, ETag) of any precompressed
+    'name.br' / 'name.gz' files next to it, in ASSET_ENCODINGS order."""
+    files = {}
+    root = str(path)
+    for dirpath, _, filenames in os.walk(root):
+        for name in filenames:
+            full = os.path.join(dirpath, name)
+            st = os.stat(full)
+            rel = os.path.relpath(full, root).replace(os.sep, '/')
+            files[rel] = (full, st.st_size, '"%x-%x"' % (st.st_mtime_ns, st.st_size))
+    table = {}
+    for rel, (full, size, etag) in files.items():
+        content_type, _ = mimetypes.guess_type(rel)
+        encoded = tuple((coding,) + files[rel + suffix]
+                        for coding, suffix in ASSET_ENCODINGS if rel + suffix in files)
+        table[rel] = (full, content_type or 'application/octet-stream', size, etag, encoded)
+    return table
+
+
+def warm_caches():
+    """Fill the file caches in parallel so the first dashboard load doesn't pay for parsing/gzip.
+    A file that fails to load is logged here, at startup, rather than on the first request."""
+    jobs = [
+        (INDEX_PATH, build_index_html),
+        (PERSONAS_PATH, build_personas_json),
+        (LANGUAGE_VOICES_PATH, read_json),
+        (CSV_PATH, build_simulated_feed_json),
+        (CSV_PATH, build_simulated_insights_json),
+        (CSV_PATH, build_simulated_categories_json),
+        (DASHBOARD_DIR, build_asset_table),
+    ]
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = [(path, build, pool.submit(load_cached, path, build)) for path, build in jobs]
+    for path, build, future in futures:
+        e = future.exception()
+        if e is not None:
+            log.warning(f"Cache warm-up failed for {path} ({build.__name__}): {e}")
+
+
 def scan_identity_dir(dir_path):
     """Scan a directory for *.json identity files; return list of { id, name, tagline, description }."""
     out = []
-    if not dir_path.is_dir():
+    try:
+        # scandir's DirEntry carries the file type from getdents: no stat per file
+        with os.scandir(dir_path) as it:
+            entries = sorted(
+                (e for e in it
+                 if e.name.endswith('.json') and not e.name.startswith('.') and e.is_file()),
+                key=lambda e: e.name,
+            )
+    except OSError:
         return out
-    for f in sorted(dir_path.glob('*.json')):
+    for e in entries:
+        stem = e.name[:-5]
         try:
-            with open(f, 'r') as fp:
-                data = json.load(fp)
+            data = read_json(e.path)
             ident = data.get('identity') or {}
             out.append({
-                'id': ident.get('id') or f.stem,
-                'name': ident.get('name') or f.stem,
+                'id': ident.get('id') or stem,
+                'name': ident.get('name') or stem,
                 'tagline': ident.get('tagline', ''),
                 'description': ident.get('description', ''),
             })
@@ -67,58 +343,112 @@ def scan_identity_dir(dir_path):
     return out
 
 
+def read_csv_table(path):
+    """Parse a CSV with csv.reader into ({column name: index}, rows). Each row is a list of
+    stripped fields padded to the header width, plus a trailing '' that absent columns index
+    (see csv_column), so lookups are plain list indexing instead of per-row dicts."""
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader, [])
+        width = len(header)
+        rows = []
+        for row in reader:
+            if not row:
+                continue  # blank line (DictReader skipped these too)
+            fields = [c.strip() for c in row[:width]]
+            fields.extend([''] * (width + 1 - len(fields)))
+            rows.append(fields)
+    return {name: i for i, name in enumerate(header)}, rows
+
+
+def csv_column(columns, name):
+    """Row index of column name in a read_csv_table result (-1, the '' pad, when absent)."""
+    return columns.get(name, -1)
+
+
+def load_simulated(build, default):
+    """build(CSV_PATH) through load_cached (rebuilt only when the CSV changes); default if the
+    CSV is missing. Callers must not mutate the result."""
+    try:
+        return load_cached(CSV_PATH, build)
+    except FileNotFoundError:
+        return default
+
+
+# Columns copied into each /api/simulated/feed item, after 'channel'
+FEED_COLUMNS = (
+    'timestamp', 'transmission_type', 'person_from', 'person_to', 'message', 'location',
+    'priority', 'request_category', 'task_status', 'role_from', 'role_to',
+)
+
+# build_simulated_views result when the CSV is missing
+EMPTY_SIMULATED_VIEWS = {'feed': [], 'categories': {}, 'requests': {}}
+
+
 def load_simulated_feed():
     """Read hotel_14day.csv and return list of { channel, timestamp, transmission_type, person_from, person_to, message, location, priority, ... }."""
-    if not CSV_PATH.is_file():
-        return []
-    out = []
-    with open(CSV_PATH, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            dept = (row.get('department_from') or '').strip()
-            ch = DEPT_TO_CHANNEL.get(dept)
-            if ch is None:
-                continue
-            ts = (row.get('timestamp') or '').strip()
-            out.append({
-                'channel': ch,
-                'timestamp': ts,
-                'transmission_type': (row.get('transmission_type') or '').strip(),
-                'person_from': (row.get('person_from') or '').strip(),
-                'person_to': (row.get('person_to') or '').strip(),
-                'message': (row.get('message') or '').strip(),
-                'location': (row.get('location') or '').strip(),
-                'priority': (row.get('priority') or '').strip(),
-                'request_category': (row.get('request_category') or '').strip(),
-                'task_status': (row.get('task_status') or '').strip(),
-                'role_from': (row.get('role_from') or '').strip(),
-                'role_to': (row.get('role_to') or '').strip(),
-            })
-    return out
+    return load_simulated(build_simulated_views, EMPTY_SIMULATED_VIEWS)['feed']
+
+
+def build_simulated_feed_json(path):
+    """Serialize the /api/simulated/feed response body (path is the CSV, for load_cached)."""
+    return json_dumps({'items': load_simulated_feed()})
 
 
 def load_simulated_categories():
     """Aggregate CSV by channel and request_category (request-type rows only). Returns { "1": { "extra_towels": n, ... }, ... }."""
-    if not CSV_PATH.is_file():
-        return {}
-    by_channel = {}
-    with open(CSV_PATH, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if (row.get('transmission_type') or '').strip().lower() != 'request':
-                continue
-            dept = (row.get('department_from') or '').strip()
-            ch = DEPT_TO_CHANNEL.get(dept)
-            if ch is None:
-                continue
-            cat = (row.get('request_category') or '').strip()
-            if not cat or not cat.replace('_', '').isalnum():
-                continue
-            ch_key = str(ch)
-            if ch_key not in by_channel:
-                by_channel[ch_key] = {}
-            by_channel[ch_key][cat] = by_channel[ch_key].get(cat, 0) + 1
-    return by_channel
+    return load_simulated(build_simulated_views, EMPTY_SIMULATED_VIEWS)['categories']
+
+
+def build_simulated_categories_json(path):
+    """Serialize the /api/simulated/categories response body (path is the CSV, for load_cached)."""
+    return json_dumps(load_simulated_categories())
+
+
+def build_simulated_views(path):
+    """Everything the simulated endpoints derive from the CSV, built in one pass over its rows
+    (once per CSV version): { 'feed': load_simulated_feed items, 'categories':
+    load_simulated_categories counts, 'requests': { channel: [ { timestamp, hour, request_category,
+    location, priority }, ... ] } }."""
+    columns, rows = load_cached(path, read_csv_table)
+    i_type = csv_column(columns, 'transmission_type')
+    i_dept = csv_column(columns, 'department_from')
+    i_ts = csv_column(columns, 'timestamp')
+    i_cat = csv_column(columns, 'request_category')
+    i_loc = csv_column(columns, 'location')
+    i_prio = csv_column(columns, 'priority')
+    picks = [(name, csv_column(columns, name)) for name in FEED_COLUMNS]
+    feed = []
+    categories = {}
+    valid_cats = {}
+    requests = defaultdict(list)
+    for row in rows:
+        ch = DEPT_TO_CHANNEL.get(row[i_dept])
+        if ch is None:
+            continue
+        item = {'channel': ch}
+        for name, i in picks:
+            item[name] = row[i]
+        feed.append(item)
+        if row[i_type].lower() != 'request':
+            continue
+        cat = row[i_cat]
+        ts = row[i_ts]
+        requests[ch].append({
+            'timestamp': ts,
+            'hour': _hour_from_iso(ts),
+            'request_category': cat,
+            'location': row[i_loc],
+            'priority': row[i_prio].lower(),
+        })
+        ok = valid_cats.get(cat)
+        if ok is None:
+            # The file has a few dozen distinct categories: test each one once
+            ok = valid_cats[cat] = bool(cat) and cat.replace('_', '').isalnum()
+        if ok:
+            counts = categories.setdefault(str(ch), {})
+            counts[cat] = counts.get(cat, 0) + 1
+    return {'feed': feed, 'categories': categories, 'requests': dict(requests)}
 
 
 # Human-readable category names for insights
@@ -137,59 +467,91 @@ CATEGORY_LABELS = {
 }
 
 
+_ROOM_RE = re.compile(r'Room\s*(\d+)', re.I)
+
+
 def _parse_room(location):
     """Extract room number from location string (e.g. 'Room 704' -> 704). Returns None if not a room."""
     if not location:
         return None
-    m = re.match(r'Room\s*(\d+)', location.strip(), re.I)
+    s = location.strip()
+    if s[:4].lower() != 'room':
+        return None
+    # Locations are uniformly 'Room 704': scan the ASCII digits directly, keeping the regex
+    # for anything else (e.g. non-ASCII digits)
+    tail = s[4:].lstrip()
+    end = 0
+    while end < len(tail) and tail[end] in '0123456789':
+        end += 1
+    if end:
+        return int(tail[:end])
+    m = _ROOM_RE.match(s)
     return int(m.group(1)) if m else None
 
 
+def _hour_from_iso(ts):
+    """Hour of an ISO-8601 timestamp, or None. Reads it straight from 'YYYY-MM-DDTHH:...'
+    and only falls back to datetime.fromisoformat for other layouts."""
+    h = ts[11:13]
+    if len(ts) >= 16 and ts[10] in 'T ' and ts[13] == ':' and h.isascii() and h.isdigit():
+        hour = int(h)
+        return hour if hour < 24 else None
+    if datetime is None:
+        return None
+    try:
+        return datetime.fromisoformat(ts.replace('Z', '+00:00')).hour
+    except ValueError:
+        return None
+
+
+# /api/simulated/insights body for a channel without requests
+EMPTY_INSIGHTS_JSON = json_dumps({'insights': []})
+
+
+def build_simulated_insights_json(path):
+    """/api/simulated/insights response bodies per channel: { channel: bytes }."""
+    insights = load_cached(path, build_simulated_insights)
+    return {ch: json_dumps({'insights': items}) for ch, items in insights.items()}
+
+
 def load_simulated_insights(channel):
     """Derive insight tidbits for a channel from CSV (request-type rows only). Returns list of { id, text, subtext }."""
-    if not CSV_PATH.is_file() or channel is None:
-        return []
-    ch = int(channel)
-    requests = []
-    with open(CSV_PATH, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            if (row.get('transmission_type') or '').strip().lower() != 'request':
-                continue
-            dept = (row.get('department_from') or '').strip()
-            if DEPT_TO_CHANNEL.get(dept) != ch:
-                continue
-            requests.append({
-                'timestamp': (row.get('timestamp') or '').strip(),
-                'request_category': (row.get('request_category') or '').strip(),
-                'location': (row.get('location') or '').strip(),
-                'priority': (row.get('priority') or '').strip().lower(),
-            })
-    if not requests:
+    if channel is None:
         return []
+    return load_simulated(build_simulated_insights, {}).get(int(channel), [])
+
+
+def build_simulated_insights(path):
+    """Insights for every channel with requests, computed once per CSV version: { channel: [...] }."""
+    requests = load_cached(path, build_simulated_views)['requests']
+    return {ch: derive_insights(reqs) for ch, reqs in requests.items()}
+
 
+def derive_insights(requests):
+    """Insight tidbits for one channel's request list (see build_simulated_views)."""
     insights = []
-    # Peak hour
-    if datetime:
-        hour_counts = defaultdict(int)
-        for r in requests:
-            ts = r.get('timestamp') or ''
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                hour_counts[dt.hour] += 1
-            except Exception:
-                continue
-        if hour_counts:
-            peak_hour = max(hour_counts, key=hour_counts.get)
-            h12 = peak_hour if peak_hour <= 12 else peak_hour - 12
-            am_pm = 'AM' if peak_hour < 12 else 'PM'
-            if peak_hour == 0:
-                h12, am_pm = 12, 'AM'
-            insights.append({
-                'id': 'peak_hour',
-                'text': 'Most requests occur in the morning (6 AM–12 PM).' if peak_hour < 12 else 'Most requests occur in the afternoon (12–6 PM).',
-                'subtext': 'Peak hour: {} {}'.format(h12, am_pm),
-            })
+    # Peak hour (and the morning share below) from one pass over a 24-slot histogram; ties go
+    # to the hour seen first
+    hour_counts = [0] * 24
+    seen = []
+    for r in requests:
+        hour = r['hour']
+        if hour is not None:
+            if not hour_counts[hour]:
+                seen.append(hour)
+            hour_counts[hour] += 1
+    morning = sum(hour_counts[:12])
+    if seen:
+        peak_hour = max(seen, key=hour_counts.__getitem__)
+        h12 = peak_hour if peak_hour <= 12 else peak_hour - 12
+        am_pm = 'AM' if peak_hour < 12 else 'PM'
+        if peak_hour == 0:
+            h12, am_pm = 12, 'AM'
+        insights.append({
+            'id': 'peak_hour',
+            'text': 'Most requests occur in the morning (6 AM–12 PM).' if peak_hour < 12 else 'Most requests occur in the afternoon (12–6 PM).',
+            'subtext': 'Peak hour: {} {}'.format(h12, am_pm),
+        })
 
     # Top category
     cat_counts = defaultdict(int)
@@ -209,33 +571,19 @@ def load_simulated_insights(channel):
         })
 
     # Morning vs afternoon share
-    if datetime and requests:
-        morning = sum(1 for r in requests for _ in [r.get('timestamp')] if _ and (lambda t: datetime.fromisoformat(t.replace('Z', '+00:00')).hour < 12 if datetime else False)(_))
-        # Safer loop
-        morning = 0
-        for r in requests:
-            ts = r.get('timestamp') or ''
-            try:
-                dt = datetime.fromisoformat(ts.replace('Z', '+00:00'))
-                if dt.hour < 12:
-                    morning += 1
-            except Exception:
-                pass
-        total = len(requests)
-        if total:
-            pct = round(100 * morning / total)
-            if pct >= 55:
-                insights.append({
-                    'id': 'time_of_day',
-                    'text': 'Requests usually take place in the morning.',
-                    'subtext': '{}% of requests occur before noon.'.format(pct),
-                })
-            elif pct <= 45:
-                insights.append({
-                    'id': 'time_of_day',
-                    'text': 'Requests usually take place in the afternoon.',
-                    'subtext': '{}% of requests occur after noon.'.format(100 - pct),
-                })
+    pct = round(100 * morning / len(requests))
+    if pct >= 55:
+        insights.append({
+            'id': 'time_of_day',
+            'text': 'Requests usually take place in the morning.',
+            'subtext': '{}% of requests occur before noon.'.format(pct),
+        })
+    elif pct <= 45:
+        insights.append({
+            'id': 'time_of_day',
+            'text': 'Requests usually take place in the afternoon.',
+            'subtext': '{}% of requests occur after noon.'.format(100 - pct),
+        })
 
     # Maintenance/HVAC/plumbing concentration by room range
     maintenance_cats = {'plumbing_issue', 'hvac_issue', 'maintenance_issue_found'}
@@ -270,154 +618,469 @@ def load_simulated_insights(channel):
     return insights[:6]
 
 
+def _pair_events_locked():
+    """Pair transcript/llm_response events into exchanges (newest first). Caller holds events_lock.
+    Memoized until the next notify; also records the exchange answered by the newest llm_response."""
+    if _exchanges_cache['revision'] == events_revision:
+        return _exchanges_cache['exchanges']
+    exchanges = []
+    # Exchanges still waiting for a response, oldest first; a response fills the newest one
+    unanswered = []
+    answered = None
+    # Hot loop: prebind bound methods instead of re-resolving them per event
+    add_exchange = exchanges.append
+    add_unanswered = unanswered.append
+    for event in reversed(events):
+        get = event.get
+        event_type = get('event_type')
+
+        if event_type == 'transcript':
+            exchange = {
+                'session_id': get('session_id', 'unknown'),
+                'timestamp_ms': get('timestamp_ms', 0),
+                'transcript': get('data', ''),
+                'response': '',
+                'persona_name': get('persona_name', 'Unknown'),
+                'language': get('language', 'en'),
+                'channel': get('channel'),
+            }
+            add_exchange(exchange)
+            add_unanswered(exchange)
+
+        elif event_type == 'llm_response':
+            answered = None
+            if unanswered:
+                response = get('data', '')
+                answered = unanswered[-1]
+                answered['response'] = response
+                if response:
+                    unanswered.pop()
+
+    exchanges.reverse()
+    _exchanges_cache['revision'] = events_revision
+    _exchanges_cache['exchanges'] = exchanges
+    _exchanges_cache['answered'] = answered
+    _exchanges_cache['body'] = _exchanges_cache['gzip'] = None
+    return exchanges
+
+
+def get_exchanges():
+    """Exchanges paired from the in-memory events, newest first."""
+    with events_lock:
+        return _pair_events_locked()
+
+
+def get_feed_body(gzipped=False):
+    """(ETag, /api/feed JSON bytes, gzip of them or None), serialized once per events revision;
+    the gzip form is only made when asked for and the body is over GZIP_MIN_BYTES, and then
+    gets its own ETag."""
+    with events_lock:
+        exchanges = _pair_events_locked()
+        body = _exchanges_cache['body']
+        if body is None:
+            body = _exchanges_cache['body'] = json_dumps({'exchanges': exchanges})
+        gz = None
+        if gzipped and len(body) > GZIP_MIN_BYTES:
+            gz = _exchanges_cache['gzip']
+            if gz is None:
+                gz = _exchanges_cache['gzip'] = gzip.compress(body, 6)
+        return feed_etag(gz is not None), body, gz
+
+
+def sse_frame(event, data):
+    """Encode one Server-Sent Events frame."""
+    return b'event: ' + event.encode('ascii') + b'\ndata: ' + json_dumps(data) + b'\n\n'
+
+
+# /api/feed/notify success body, encoded once
+NOTIFY_OK_JSON = json_dumps({'status': 'ok'})
+
+
+def add_event(data):
+    """Store a posted event and push the exchange it created or answered to SSE subscribers."""
+    global events_revision
+    with events_lock:
+        events.appendleft(data)
+        events_revision += 1
+        event_type = data.get('event_type')
+        if event_type not in ('transcript', 'llm_response'):
+            return
+        exchanges = _pair_events_locked()
+        if event_type == 'transcript':
+            frame = sse_frame('new_transcript', exchanges[0])
+        elif _exchanges_cache['answered'] is not None:
+            frame = sse_frame('new_response', _exchanges_cache['answered'])
+        else:
+            return
+    with subscribers_lock:
+        for q in list(subscribers):
+            try:
+                q.put_nowait(frame)
+            except queue.Full:
+                # Slow client: it would miss this exchange. Drop it and end its stream (None);
+                # EventSource reconnects and gets a fresh snapshot
+                subscribers.remove(q)
+                _drain(q)
+                q.put_nowait(None)
+
+
+def _drain(q):
+    """Discard everything queued in q."""
+    try:
+        while True:
+            q.get_nowait()
+    except queue.Empty:
+        pass
+
+
+def feed_etag(gzipped=False):
+    """ETag for /api/feed; changes whenever an event is posted (-gz for the gzip form)."""
+    return '"{}-{}{}"'.format(_BOOT_ID, events_revision, '-gz' if gzipped else '')
+
+
 class SimpleFeedHandler(BaseHTTPRequestHandler):
 
-    def send_json(self, data, status=200):
-        """Helper to send JSON response"""
+    # HTTP/1.1 keeps polling connections alive; every response must carry Content-Length
+    protocol_version = 'HTTP/1.1'
+    # Headers and body go out as separate writes; without TCP_NODELAY the body waits on the
+    # client's delayed ACK (~40 ms per request on a kept-alive connection)
+    disable_nagle_algorithm = True
+    # Buffer wfile so the header block and a small body leave in one send (flushed after each
+    # request); anything written around wfile (sendfile) or streamed must flush it first
+    wbufsize = 64 * 1024
+
+    def send_bytes(self, body, content_type, status=200, headers=None):
+        """Send a complete response body with Content-Type and Content-Length."""
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Content-Length', len(body))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_json(self, data, status=200, headers=None):
+        """Helper to send JSON response (compact, with Content-Length)"""
+        self.send_json_bytes(json_dumps(data), status, headers)
+
+    def send_json_bytes(self, body, status=200, headers=None, gzipped=None):
+        """Send pre-serialized JSON; gzips (fast level, unless already-compressed gzipped bytes
+        are given) bodies over GZIP_MIN_BYTES when accepted."""
+        if len(body) > GZIP_MIN_BYTES:
+            headers = dict(headers or {}, Vary='Accept-Encoding')
+            if self.accepts_gzip():
+                body = gzipped if gzipped is not None else gzip.compress(body, 1)
+                headers['Content-Encoding'] = 'gzip'
+        self.send_bytes(body, 'application/json', status, headers)
+
+    def accepts_gzip(self):
+        """True when the request's Accept-Encoding allows gzip."""
+        return 'gzip' in self.headers.get('Accept-Encoding', '')
+
+    def send_cached_json(self, path, build, select=None, default=None):
+        """Send load_cached(path, build) JSON bytes with an ETag from the path's stamp (304 when
+        the client already has it); the gzip form is cached alongside. With select, build
+        returns a dict of bodies and the one under that (int) key, or default, is sent."""
+        stamp, body = load_cached_stamped(path, build)
+        if select is not None:
+            body = body.get(select, default)
+            stamp += (select,)
+        # send_json_bytes gzips exactly these; the gzip form gets its own ETag
+        gzip_ok = len(body) > GZIP_MIN_BYTES and self.accepts_gzip()
+        etag = '"{}{}"'.format('-'.join('%x' % v for v in stamp), '-gz' if gzip_ok else '')
+        if self.send_not_modified(etag):
+            return
+        gzipped = None
+        if select is None and gzip_ok:
+            gzipped = gzip_cached(path, build, stamp, body)
+        self.send_json_bytes(body, headers={'ETag': etag, 'Cache-Control': 'no-cache'}, gzipped=gzipped)
+
+    def send_config(self):
+        """GET /api/config: the selection from active.json (else config.json) plus the STT
+        language, with an ETag from both files' stamps (304 when unchanged)."""
+        try:
+            config_stamp, config = load_cached_stamped(CONFIG_PATH)
+        except FileNotFoundError:
+            config_stamp, config = (), None
+        try:
+            active_stamp, active_data = load_cached_stamped(ACTIVE_PATH)
+        except FileNotFoundError:
+            active_stamp, active_data = (), None
+        if config is None and active_data is None:
+            raise FileNotFoundError('config.json not found')
+        etag = '"{}.{}"'.format('-'.join('%x' % v for v in config_stamp),
+                                '-'.join('%x' % v for v in active_stamp))
+        if self.send_not_modified(etag):
+            return
+        input_lang = config.get('stt', {}).get('language', '') if config is not None else ''
+        if active_data is not None:
+            data = {
+                'active': active_data.get('active', ''),
+                'language': active_data.get('response_language', ''),
+                'response_language': active_data.get('response_language', ''),
+                'input_language': input_lang,
+            }
+        else:
+            data = {
+                'persona': config.get('llm', {}).get('agent_persona', ''),
+                'language': config.get('llm', {}).get('response_language', ''),
+                'input_language': input_lang,
+            }
+        self.send_json(data, headers={'ETag': etag, 'Cache-Control': 'no-cache'})
+
+    def send_empty(self, status, headers=None):
+        """Send a bodyless response (e.g. 404)."""
         self.send_response(status)
-        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', 0)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+
+    def send_not_modified(self, etag):
+        """Reply 304 when the client's If-None-Match matches etag. Returns True if sent."""
+        if self.headers.get('If-None-Match') != etag:
+            return False
+        self.send_response(304)
+        self.send_header('ETag', etag)
         self.end_headers()
-        self.wfile.write(json.dumps(data).encode())
+        return True
 
-    def send_file(self, filepath):
-        """Serve a file with appropriate Content-Type."""
+    def accepted_encodings(self):
+        """Content-codings named in the request's Accept-Encoding (q=0 entries excluded)."""
+        codings = set()
+        for part in self.headers.get('Accept-Encoding', '').split(','):
+            coding, _, params = part.partition(';')
+            if params.replace(' ', '') not in ('q=0', 'q=0.0', 'q=0.00', 'q=0.000'):
+                codings.add(coding.strip().lower())
+        return codings
+
+    def send_asset(self, asset):
+        """Serve one build_asset_table entry (304 on a matching If-None-Match), or its
+        precompressed sibling when the client accepts that encoding. The body goes out with
+        socket.sendfile (os.sendfile where available: no userspace copy)."""
+        filepath, content_type, size, etag, encoded = asset
+        content_encoding = None
+        if encoded:
+            accepted = self.accepted_encodings()
+            for coding, enc_path, enc_size, enc_etag in encoded:
+                if coding in accepted:
+                    content_encoding = coding
+                    filepath, size, etag = enc_path, enc_size, enc_etag
+                    break
+        if self.send_not_modified(etag):
+            return
         try:
-            with open(filepath, 'rb') as f:
-                data = f.read()
+            f = open(filepath, 'rb')
         except OSError:
-            self.send_response(404)
-            self.end_headers()
+            self.send_empty(404)
             return
-        content_type, _ = mimetypes.guess_type(str(filepath))
-        content_type = content_type or 'application/octet-stream'
+        with f:
+            self.send_response(200)
+            self.send_header('Content-Type', content_type)
+            self.send_header('Content-Length', size)
+            self.send_header('ETag', etag)
+            if encoded:
+                self.send_header('Vary', 'Accept-Encoding')
+            if content_encoding:
+                self.send_header('Content-Encoding', content_encoding)
+            self.end_headers()
+            if size:
+                self.wfile.flush()
+                self.connection.sendfile(f, 0, size)
+
+    def send_index(self):
+        """Serve the dashboard SPA entry from memory, gzipped when accepted (304 on a matching
+        If-None-Match). Returns False if not built."""
+        try:
+            stamp, (html, html_gz) = load_cached_stamped(INDEX_PATH, build_index_html)
+        except OSError:
+            return False
+        gzipped = self.accepts_gzip()
+        etag = '"{}{}"'.format('-'.join('%x' % v for v in stamp), '-gz' if gzipped else '')
+        if self.send_not_modified(etag):
+            return True
+        headers = {'Vary': 'Accept-Encoding', 'ETag': etag, 'Cache-Control': 'no-cache'}
+        if gzipped:
+            headers['Content-Encoding'] = 'gzip'
+        self.send_bytes(html_gz if gzipped else html, 'text/html', headers=headers)
+        return True
+
+    def stream_feed(self):
+        """GET /api/feed/stream: snapshot, then new_transcript/new_response events as they are posted."""
+        q = queue.Queue(maxsize=SSE_QUEUE_SIZE)
         self.send_response(200)
-        self.send_header('Content-Type', content_type)
-        self.send_header('Content-Length', len(data))
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
         self.end_headers()
-        self.wfile.write(data)
+        # No Content-Length: the stream ends when the connection closes
+        self.close_connection = True
+        # Subscribe before taking the snapshot so no event falls in between
+        with subscribers_lock:
+            subscribers.append(q)
+        try:
+            self.wfile.write(sse_frame('snapshot', {'exchanges': get_exchanges()}))
+            self.wfile.flush()
+            while True:
+                try:
+                    frame = q.get(timeout=SSE_HEARTBEAT_S)
+                except queue.Empty:
+                    frame = b': heartbeat\n\n'
+                if frame is None:
+                    break  # Dropped by add_event for falling behind; the client reconnects
+                self.wfile.write(frame)
+                self.wfile.flush()
+        except OSError:
+            pass  # Client went away
+        finally:
+            with subscribers_lock:
+                if q in subscribers:
+                    subscribers.remove(q)
+
+    def read_json_body(self):
+        """Parse the request body (bytes straight into json_loads) as a JSON object. Replies 400
+        for a malformed or negative Content-Length or a non-object body, 413 when it is over
+        MAX_BODY_BYTES, and returns BODY_REJECTED."""
+        try:
+            length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            length = -1
+        if length < 0 or length > MAX_BODY_BYTES:
+            # Body length unknown or body left unread; don't reuse the connection
+            self.close_connection = True
+            if length < 0:
+                self.send_json({'error': 'Invalid Content-Length'}, 400, {'Connection': 'close'})
+            else:
+                self.send_json({'error': 'Request body too large'}, 413, {'Connection': 'close'})
+            return BODY_REJECTED
+        data = json_loads(self.rfile.read(length))
+        if not isinstance(data, dict):
+            self.send_json({'error': 'Request body must be a JSON object'}, 400)
+            return BODY_REJECTED
+        return data
 
     def do_POST(self):
         """Handle POST requests"""
         if self.path == '/api/config':
             try:
-                length = int(self.headers.get('Content-Length', 0))
-                body = self.rfile.read(length)
-                updates = json.loads(body.decode('utf-8'))
+                updates = self.read_json_body()
+                if updates is BODY_REJECTED:
+                    return
 
                 # Load language_voices mapping
                 language_voices = {}
-                if (CONFIG_DIR / 'language_voices.json').exists():
+                if LANGUAGE_VOICES_PATH.exists():
                     try:
-                        with open(CONFIG_DIR / 'language_voices.json', 'r') as f:
-                            language_voices = json.load(f)
+                        language_voices = load_cached(LANGUAGE_VOICES_PATH)
                     except Exception:
                         pass
 
-                if 'active' in updates or ACTIVE_PATH.exists():
-                    active_data = {}
-                    if ACTIVE_PATH.exists():
-                        try:
-                            with open(ACTIVE_PATH, 'r') as f:
-                                active_data = json.load(f)
-                        except Exception:
-                            pass
-                    if 'active' in updates:
-                        active_data['active'] = updates['active']
-                    if 'language' in updates:
-                        active_data['response_language'] = updates['language']
-
-                        # Also update main config voice path when language changes
-                        if CONFIG_PATH.exists() and updates['language'] in language_voices:
+                # One POST at a time through the read-modify-write of active.json / config.json
+                with config_lock:
+                    if 'active' in updates or ACTIVE_PATH.exists():
+                        active_data = {}
+                        if ACTIVE_PATH.exists():
                             try:
-                                with open(CONFIG_PATH, 'r') as f:
-                                    config = json.load(f)
+                                active_data = dict(load_cached(ACTIVE_PATH))
+                            except Exception:
+                                pass
+                        if 'active' in updates:
+                            active_data['active'] = updates['active']
+                        if 'language' in updates:
+                            active_data['response_language'] = updates['language']
+
+                        # Voice path (language change) and STT language go to config.json in one
+                        # read and one write
+                        update_voice = 'language' in updates and updates['language'] in language_voices
+                        update_stt = 'input_language' in updates
+                        if (update_voice or update_stt) and CONFIG_PATH.exists():
+                            config = None
+                            changed = False
+                            try:
+                                config = copy.deepcopy(load_cached(CONFIG_PATH))
+                            except Exception as e:
+                                log.warning(f"Warning: Failed to read config: {e}")
+                            if config is not None and update_voice:
+                                # Also update main config voice path when language changes
+                                try:
+                                    voice_filename = language_voices[updates['language']]
+                                    voice_models_dir = config.get('tts', {}).get('voice_models_dir', '/home/oliver/models/piper')
+                                    if voice_models_dir:
+                                        config['tts']['voice_path'] = str(Path(voice_models_dir) / voice_filename)
+                                    else:
+                                        config['tts']['voice_path'] = f"/home/oliver/models/piper/{voice_filename}"
+                                    config['llm']['response_language'] = updates['language']
+                                    changed = True
+                                    log.info(f"Updated voice path to: {config['tts']['voice_path']}")
+                                except Exception as e:
+                                    log.warning(f"Warning: Failed to update voice path: {e}")
+                            if config is not None and update_stt:
+                                try:
+                                    config['stt']['language'] = updates['input_language']
+                                    changed = True
+                                    log.info(f"Updated STT language to: {updates['input_language']}")
+                                except Exception as e:
+                                    log.warning(f"Warning: Failed to update STT language: {e}")
+                            if changed:
+                                try:
+                                    write_json(CONFIG_PATH, config)
+                                except Exception as e:
+                                    log.warning(f"Warning: Failed to write config: {e}")
+
+                        write_json(ACTIVE_PATH, active_data)
+                        log.info(f"Active updated: {active_data.get('active', '')}, language: {active_data.get('response_language', '')}")
+                        self.send_json({'status': 'ok', 'message': 'Language updated. Restart the memo-rf agent (e.g. ./run.sh or systemctl restart memo-rf) to apply changes.'})
+                    else:
+                        if not CONFIG_PATH.exists():
+                            self.send_json({'error': 'config.json not found'}, 500)
+                            return
+                        config = copy.deepcopy(load_cached(CONFIG_PATH))
+                        if 'persona' in updates:
+                            config['llm']['agent_persona'] = updates['persona']
+                        if 'language' in updates:
+                            config['llm']['response_language'] = updates['language']
+
+                            if updates['language'] in language_voices:
                                 voice_filename = language_voices[updates['language']]
                                 voice_models_dir = config.get('tts', {}).get('voice_models_dir', '/home/oliver/models/piper')
                                 if voice_models_dir:
                                     config['tts']['voice_path'] = str(Path(voice_models_dir) / voice_filename)
                                 else:
                                     config['tts']['voice_path'] = f"/home/oliver/models/piper/{voice_filename}"
-                                config['llm']['response_language'] = updates['language']
-                                with open(CONFIG_PATH, 'w') as f:
-                                    json.dump(config, f, indent=2)
-                                print(f"Updated voice path to: {config['tts']['voice_path']}")
-                            except Exception as e:
-                                print(f"Warning: Failed to update voice path: {e}")
+                                log.info(f"Updated voice path to: {config['tts']['voice_path']}")
 
-                    if 'input_language' in updates:
-                        if CONFIG_PATH.exists():
-                            try:
-                                with open(CONFIG_PATH, 'r') as f:
-                                    config = json.load(f)
-                                config['stt']['language'] = updates['input_language']
-                                with open(CONFIG_PATH, 'w') as f:
-                                    json.dump(config, f, indent=2)
-                                print(f"Updated STT language to: {updates['input_language']}")
-                            except Exception as e:
-                                print(f"Warning: Failed to update STT language: {e}")
-
-                    with open(ACTIVE_PATH, 'w') as f:
-                        json.dump(active_data, f, indent=2)
-                    print(f"Active updated: {active_data.get('active', '')}, language: {active_data.get('response_language', '')}")
-                    self.send_json({'status': 'ok', 'message': 'Language updated. Restart the memo-rf agent (e.g. ./run.sh or systemctl restart memo-rf) to apply changes.'})
-                else:
-                    if not CONFIG_PATH.exists():
-                        self.send_json({'error': 'config.json not found'}, 500)
-                        return
-                    with open(CONFIG_PATH, 'r') as f:
-                        config = json.load(f)
-                    if 'persona' in updates:
-                        config['llm']['agent_persona'] = updates['persona']
-                    if 'language' in updates:
-                        config['llm']['response_language'] = updates['language']
-
-                        if updates['language'] in language_voices:
-                            voice_filename = language_voices[updates['language']]
-                            voice_models_dir = config.get('tts', {}).get('voice_models_dir', '/home/oliver/models/piper')
-                            if voice_models_dir:
-                                config['tts']['voice_path'] = str(Path(voice_models_dir) / voice_filename)
-                            else:
-                                config['tts']['voice_path'] = f"/home/oliver/models/piper/{voice_filename}"
-                            print(f"Updated voice path to: {config['tts']['voice_path']}")
-
-                    if 'input_language' in updates:
-                        config['stt']['language'] = updates['input_language']
-                        print(f"Updated STT language to: {updates['input_language']}")
-
-                    with open(CONFIG_PATH, 'w') as f:
-                        json.dump(config, f, indent=2)
-                    print(f"Config updated: persona={updates.get('persona', 'unchanged')}, language={updates.get('language', 'unchanged')}, input_language={updates.get('input_language', 'unchanged')}")
-                    self.send_json({'status': 'ok', 'message': 'Config updated. Restart agent to apply.'})
+                        if 'input_language' in updates:
+                            config['stt']['language'] = updates['input_language']
+                            log.info(f"Updated STT language to: {updates['input_language']}")
+
+                        write_json(CONFIG_PATH, config)
+                        log.info(f"Config updated: persona={updates.get('persona', 'unchanged')}, language={updates.get('language', 'unchanged')}, input_language={updates.get('input_language', 'unchanged')}")
+                        self.send_json({'status': 'ok', 'message': 'Config updated. Restart agent to apply.'})
             except Exception as e:
                 self.send_json({'error': str(e)}, 500)
 
         elif self.path == '/api/feed/notify':
             try:
-                length = int(self.headers.get('Content-Length', 0))
-                body = self.rfile.read(length)
-                data = json.loads(body.decode('utf-8'))
+                data = self.read_json_body()
+                if data is BODY_REJECTED:
+                    return
 
-                print(f"[{data.get('event_type')}] Session: {data.get('session_id')} | {data.get('data', '')[:50]}...")
+                # Per-event lines are debug-level (MEMO_DEBUG=1) with lazy formatting; str() so a
+                # missing or non-string 'data' can't fail the request
+                log.debug("[%s] Session: %s | %s...", data.get('event_type'), data.get('session_id'),
+                          str(data.get('data') or '')[:50])
 
-                events.insert(0, data)
-                if len(events) > MAX_EVENTS:
-                    events.pop()
+                add_event(data)
 
-                print(f"Total events in memory: {len(events)}")
+                log.debug("Total events in memory: %d", len(events))
 
-                self.send_response(200)
-                self.send_header('Content-Type', 'application/json')
-                self.end_headers()
-                self.wfile.write(b'{"status":"ok"}')
+                self.send_json_bytes(NOTIFY_OK_JSON)
 
             except Exception as e:
-                self.send_response(500)
-                self.send_header('Content-Type', 'application/json')
-                self.end_headers()
-                self.wfile.write(json.dumps({'error': str(e)}).encode())
+                self.send_json({'error': str(e)}, 500)
         else:
-            self.send_response(404)
-            self.end_headers()
+            # Body was not read; don't reuse the connection
+            self.close_connection = True
+            self.send_empty(404, {'Connection': 'close'})
 
     def do_GET(self):
         """Handle GET requests"""
@@ -425,115 +1088,62 @@ class SimpleFeedHandler(BaseHTTPRequestHandler):
 
         if path == '/' or path == '/index.html':
             # Serve dashboard SPA entry
-            index_path = DASHBOARD_DIR / 'index.html'
-            if index_path.is_file():
-                self.send_file(index_path)
-            else:
-                self.send_response(404)
-                self.send_header('Content-Type', 'text/plain')
-                self.end_headers()
-                self.wfile.write(b'Dashboard not built. Run: cd frontend && npm run build')
+            if not self.send_index():
+                self.send_bytes(b'Dashboard not built. Run: cd frontend && npm run build', 'text/plain', 404)
             return
 
         if path.startswith('/api/'):
             # API routes
             if path == '/api/robots':
                 try:
-                    robots = scan_identity_dir(ROBOTS_DIR)
-                    self.send_json({'robots': robots})
+                    self.send_cached_json(ROBOTS_DIR, build_robots_json)
+                except FileNotFoundError:
+                    self.send_json({'robots': []})
                 except Exception as e:
                     self.send_json({'error': str(e)}, 500)
                 return
             if path == '/api/agents':
                 try:
-                    agents = scan_identity_dir(AGENTS_DIR)
-                    self.send_json({'agents': agents})
+                    self.send_cached_json(AGENTS_DIR, build_agents_json)
+                except FileNotFoundError:
+                    self.send_json({'agents': []})
                 except Exception as e:
                     self.send_json({'error': str(e)}, 500)
                 return
             if path == '/api/personas':
                 try:
-                    with open(PERSONAS_PATH, 'r') as f:
-                        personas_data = json.load(f)
-                    personas_list = [
-                        {
-                            'id': k,
-                            'name': v['name'],
-                            'category': v.get('category', ''),
-                            'tagline': v.get('tagline', ''),
-                            'description': v.get('description', ''),
-                        }
-                        for k, v in personas_data.items()
-                    ]
-                    self.send_json({'personas': personas_list})
+                    self.send_cached_json(PERSONAS_PATH, build_personas_json)
                 except Exception as e:
                     self.send_json({'error': str(e)}, 500)
                 return
             if path == '/api/config':
                 try:
-                    input_lang = ''
-                    if CONFIG_PATH.exists():
-                        with open(CONFIG_PATH, 'r') as f:
-                            config_data = json.load(f)
-                        input_lang = config_data.get('stt', {}).get('language', '')
-
-                    if ACTIVE_PATH.exists():
-                        with open(ACTIVE_PATH, 'r') as f:
-                            active_data = json.load(f)
-                        self.send_json({
-                            'active': active_data.get('active', ''),
-                            'language': active_data.get('response_language', ''),
-                            'response_language': active_data.get('response_language', ''),
-                            'input_language': input_lang,
-                        })
-                    else:
-                        with open(CONFIG_PATH, 'r') as f:
-                            config = json.load(f)
-                        self.send_json({
-                            'persona': config.get('llm', {}).get('agent_persona', ''),
-                            'language': config.get('llm', {}).get('response_language', ''),
-                            'input_language': input_lang,
-                        })
+                    self.send_config()
                 except Exception as e:
                     self.send_json({'error': str(e)}, 500)
                 return
+            if path == '/api/feed/stream':
+                self.stream_feed()
+                return
             if path == '/api/feed':
-                exchanges = []
-                for event in reversed(events):
-                    event_type = event.get('event_type')
-
-                    if event_type == 'transcript':
-                        exchange = {
-                            'session_id': event.get('session_id', 'unknown'),
-                            'timestamp_ms': event.get('timestamp_ms', 0),
-                            'transcript': event.get('data', ''),
-                            'response': '',
-                            'persona_name': event.get('persona_name', 'Unknown'),
-                            'language': event.get('language', 'en'),
-                            'channel': event.get('channel'),
-                        }
-                        exchanges.append(exchange)
-
-                    elif event_type == 'llm_response':
-                        for ex in reversed(exchanges):
-                            if not ex['response']:
-                                ex['response'] = event.get('data', '')
-                                break
-
-                exchanges.reverse()
-                self.send_json({'exchanges': exchanges})
+                etag, body, gzipped = get_feed_body(self.accepts_gzip())
+                if self.send_not_modified(etag):
+                    return
+                self.send_json_bytes(body, headers={'ETag': etag, 'Cache-Control': 'no-cache'}, gzipped=gzipped)
                 return
             if path == '/api/simulated/feed':
                 try:
-                    items = load_simulated_feed()
-                    self.send_json({'items': items})
+                    self.send_cached_json(CSV_PATH, build_simulated_feed_json)
+                except FileNotFoundError:
+                    self.send_json({'items': []})
                 except Exception as e:
                     self.send_json({'error': str(e)}, 500)
                 return
             if path == '/api/simulated/categories':
                 try:
-                    by_channel = load_simulated_categories()
-                    self.send_json(by_channel)
+                    self.send_cached_json(CSV_PATH, build_simulated_categories_json)
+                except FileNotFoundError:
+                    self.send_json({})
                 except Exception as e:
                     self.send_json({'error': str(e)}, 500)
                 return
@@ -543,42 +1153,35 @@ class SimpleFeedHandler(BaseHTTPRequestHandler):
                     qs = parse_qs(parsed.query)
                     ch = qs.get('channel', ['1'])[0]
                     ch = int(ch) if str(ch).isdigit() else 1
-                    insights = load_simulated_insights(ch)
-                    self.send_json({'insights': insights})
+                    self.send_cached_json(CSV_PATH, build_simulated_insights_json, select=ch,
+                                          default=EMPTY_INSIGHTS_JSON)
+                except FileNotFoundError:
+                    self.send_json({'insights': []})
                 except Exception as e:
                     self.send_json({'error': str(e)}, 500)
                 return
 
-            self.send_response(404)
-            self.end_headers()
+            self.send_empty(404)
             return
 
-        # Static file: resolve under DASHBOARD_DIR
-        if not DASHBOARD_DIR.is_dir():
-            self.send_response(404)
-            self.end_headers()
-            return
-        # Strip leading slash and resolve (no path traversal)
-        rel = path.lstrip('/')
-        if '..' in rel or rel.startswith('/'):
-            self.send_response(404)
-            self.end_headers()
-            return
-        filepath = (DASHBOARD_DIR / rel).resolve()
-        if not str(filepath).startswith(str(DASHBOARD_DIR.resolve())):
-            self.send_response(404)
-            self.end_headers()
+        # Static file: exact lookup in the scanned build (rescanned when dashboard_dist changes),
+        # so nothing outside it can be reached
+        try:
+            assets = load_cached(DASHBOARD_DIR, build_asset_table)
+        except OSError:
+            self.send_empty(404)
             return
-        if filepath.is_file():
-            self.send_file(filepath)
+        asset = assets.get(path.lstrip('/'))
+        if asset is not None:
+            self.send_asset(asset)
         else:
             # SPA fallback: serve index.html for client-side routes
-            index_path = DASHBOARD_DIR / 'index.html'
-            if index_path.is_file():
-                self.send_file(index_path)
-            else:
-                self.send_response(404)
-                self.end_headers()
+            if not self.send_index():
+                self.send_empty(404)
+
+    def log_request(self, code='-', size='-'):
+        """Suppress request logging without formatting the access-log arguments first"""
+        pass
 
     def log_message(self, format, *args):
         """Suppress request logging"""
@@ -587,7 +1190,7 @@ class SimpleFeedHandler(BaseHTTPRequestHandler):
 
 if __name__ == '__main__':
     port = 5050
-    server = HTTPServer(('0.0.0.0', port), SimpleFeedHandler)
+    server = ThreadingHTTPServer(('0.0.0.0', port), SimpleFeedHandler)
     print(f"\n{'='*60}")
     print(f"Simple Feed Server running on port {port}")
     print(f"{'='*60}")
@@ -596,8 +1199,12 @@ if __name__ == '__main__':
     if not DASHBOARD_DIR.is_dir():
         print(f"Note:      Build dashboard first: cd frontend && npm run build")
     print(f"{'='*60}\n")
+    threading.Thread(target=warm_caches, daemon=True).start()
+    listener = start_log_listener()
     try:
         server.serve_forever()
     except KeyboardInterrupt:
         print("\nShutting down...")
         server.shutdown()
+    finally:
+        listener.stop()
@@ -1,15 +1,32 @@
 #!/usr/bin/env python3
 """Mock Muni rover API server for testing the plugin system."""
 
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import json
 import sys
 
+# Command bodies larger than this are refused with 413
+MAX_BODY_BYTES = 1 << 20
+
 class MuniAPIHandler(BaseHTTPRequestHandler):
+    # Keep-alive for repeated plugin calls; every response carries Content-Length
+    protocol_version = 'HTTP/1.1'
+    # Buffered wfile: status line, headers and body go out in one send per response
+    wbufsize = 8192
+
     def log_message(self, format, *args):
         """Custom logging to make output clearer."""
         sys.stdout.write(f"[API] {format % args}\n")
 
+    def send_json(self, data):
+        """Send a 200 JSON response with Content-Length."""
+        body = json.dumps(data).encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
     def do_POST(self):
         """Handle POST requests to /rovers/{rover_id}/command"""
         # Parse path
@@ -25,13 +42,23 @@ class MuniAPIHandler(BaseHTTPRequestHandler):
 
         rover_id = parts[2]
 
-        # Read request body
-        content_length = int(self.headers.get('Content-Length', 0))
-        body = self.rfile.read(content_length).decode('utf-8')
+        # Read request body (json.loads takes the bytes as-is)
+        try:
+            content_length = int(self.headers.get('Content-Length', 0))
+        except ValueError:
+            content_length = -1
+        # send_error closes the connection, so an unread body never reaches the next request
+        if content_length < 0:
+            self.send_error(400, "Invalid Content-Length")
+            return
+        if content_length > MAX_BODY_BYTES:
+            self.send_error(413, "Request body too large")
+            return
+        body = self.rfile.read(content_length)
 
         try:
             command = json.loads(body)
-        except json.JSONDecodeError:
+        except ValueError:  # JSONDecodeError, or UnicodeDecodeError for non-UTF-8 bytes
             self.send_error(400, "Invalid JSON")
             return
 
@@ -72,25 +99,19 @@ class MuniAPIHandler(BaseHTTPRequestHandler):
             response["mode"] = mode
 
         # Send response
-        self.send_response(200)
-        self.send_header('Content-Type', 'application/json')
-        self.end_headers()
-        self.wfile.write(json.dumps(response).encode('utf-8'))
+        self.send_json(response)
 
     def do_GET(self):
         """Handle GET requests for health checks."""
         if self.path == '/health':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({"status": "ok", "service": "muni-mock"}).encode('utf-8'))
+            self.send_json({"status": "ok", "service": "muni-mock"})
         else:
             self.send_error(404, "Not Found")
 
 def run_server(port=4890):
     """Run the mock API server."""
     server_address = ('', port)
-    httpd = HTTPServer(server_address, MuniAPIHandler)
+    httpd = ThreadingHTTPServer(server_address, MuniAPIHandler)
     print(f"\n{'='*60}")
     print(f"Mock Muni API Server running on http://localhost:{port}")
     print(f"Ready to receive commands!")